@@ -13,16 +13,30 @@ or:
 """
 
 import warnings
-from mt5_bridge import MT5Connector
+
+_WARNED = False
+
+
+def __getattr__(name):
+    # Lazily re-export for old `from mt5_connector import MT5Connector` imports
+    if name == "MT5Connector":
+        from mt5_bridge import MT5Connector
+        return MT5Connector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> int:
-    warnings.warn(
-        "mt5_connector.py is deprecated. Use 'mt5-bridge' CLI or 'from mt5_bridge import MT5Connector'",
-        DeprecationWarning,
-        stacklevel=2,
-    )
-    connector = MT5Connector()
+    global _WARNED
+    if not _WARNED:
+        warnings.warn(
+            "mt5_connector.py is deprecated. Use 'mt5-bridge' CLI or 'from mt5_bridge import MT5Connector'",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        _WARNED = True
+    from mt5_bridge import get_connector
+
+    connector = get_connector()
     ok = connector.connect()
     if not ok:
         print("Failed to initialize connector")
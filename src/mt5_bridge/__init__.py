@@ -5,6 +5,7 @@ High-level, file-based connector for MetaTrader 5 on macOS.
 Public API:
 - MT5Connector
 - get_connector
+- reset_connector
 """
 
 from .connector import (
@@ -15,7 +16,9 @@ from .connector import (
     TradeCommand,
     TradeResult,
     ClosedTrade,
+    ConnectionInfo,
     get_connector,
+    reset_connector,
 )
 
 __version__ = "0.1.0"
@@ -28,7 +31,9 @@ __all__ = [
     "TradeCommand",
     "TradeResult",
     "ClosedTrade",
+    "ConnectionInfo",
     "get_connector",
+    "reset_connector",
     "__version__",
 ]
 
@@ -1,25 +1,44 @@
 import argparse
+import functools
 import logging
-import os
-from .connector import MT5Connector
+import sys
 
+# logging.getLevelNamesMapping() is Python 3.11+
+if hasattr(logging, "getLevelNamesMapping"):
+    _LEVELS = logging.getLevelNamesMapping()
+else:
+    _LEVELS = {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL,
+    }
 
-def main() -> int:
+_MARKET_LINE = "Market: {symbol} bid={bid} ask={ask} ts={ts}\n".format_map
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="MT5 macOS file bridge CLI")
     parser.add_argument("--files-dir", help="Path to MT5 MQL5/Files directory (overrides MT5_FILES_DIR)")
     parser.add_argument("--symbol", help="Primary symbol (overrides MT5_PRIMARY_SYMBOL)")
     parser.add_argument("--log-level", default="INFO", help="Logging level (DEBUG, INFO, WARNING, ERROR)")
-    args = parser.parse_args()
+    return parser
+
 
-    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
-                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+def main() -> int:
+    args = _build_parser().parse_args()
+
+    # Imported after argument parsing so `--help` does not pay for the connector import
+    from .connector import MT5Connector
 
-    if args.files_dir:
-        os.environ["MT5_FILES_DIR"] = args.files_dir
-    if args.symbol:
-        os.environ["MT5_PRIMARY_SYMBOL"] = args.symbol
+    # Leave logging alone if the embedding application already configured it
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=_LEVELS.get(args.log_level.upper(), logging.INFO),
+                            format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
-    connector = MT5Connector()
+    connector = MT5Connector(files_dir=args.files_dir, primary_symbol=args.symbol)
     ok = connector.connect()
     if not ok:
         print("Failed to initialize connector")
@@ -27,20 +46,15 @@ def main() -> int:
 
     md = connector.get_market_data()
     if md:
-        print(f"Market: {md.symbol} bid={md.bid} ask={md.ask} ts={md.timestamp}")
+        sys.stdout.write(_MARKET_LINE({"symbol": md.symbol, "bid": md.bid, "ask": md.ask, "ts": md.timestamp}))
     else:
         print("Price file not found or invalid. Ensure EA is running and MT5_FILES_DIR is set.")
 
     info = connector.get_connection_info()
-    print("Connection info:", {
-        "files_directory": info.get("files_directory"),
-        "price_file_exists": info.get("price_file_exists"),
-        "positions_file_exists": info.get("positions_file_exists"),
-    })
+    print(f"Connection info: files_dir={info.files_directory} "
+          f"price={info.price_file_exists} pos={info.positions_file_exists}")
     return 0
 
 
 if __name__ == "__main__":  # pragma: no cover
     raise SystemExit(main())
-
-
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Config key -> environment variable backing it
+_KEY_MAP = MappingProxyType({
+    "mt5_bridge.connection_timeout_seconds": "MT5_TIMEOUT_SEC",
+    "mt5_bridge.price_file": "MT5_PRICE_FILE",
+    "trading.primary_symbol": "MT5_PRIMARY_SYMBOL",
+    "mt5_bridge.skip_historical_trade_log_on_connect": "MT5_SKIP_HIST_LOG",
+})
+
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+# Resolved values, keyed by (key, default); environment is assumed stable for the process
+_CACHE: Dict[Tuple[str, Hashable], Any] = {}
 
 
 @dataclass
@@ -11,22 +26,40 @@ class BridgeConfig:
     """Simple configuration accessor for the MT5 bridge.
 
     Values are read from environment variables with reasonable defaults.
+    Resolved values are cached for the lifetime of the process; call
+    `BridgeConfig.invalidate()` after changing the environment.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop cached values so the next lookup re-reads the environment."""
+        _CACHE.clear()
+        _resolve_files_dir.cache_clear()
+
     def get(self, key: str, default: Any = None) -> Any:
-        mapping = {
-            "mt5_bridge.connection_timeout_seconds": ("MT5_TIMEOUT_SEC", default),
-            "mt5_bridge.price_file": ("MT5_PRICE_FILE", default),
-            "trading.primary_symbol": ("MT5_PRIMARY_SYMBOL", default),
-            "mt5_bridge.skip_historical_trade_log_on_connect": ("MT5_SKIP_HIST_LOG", default),
-        }
-        env_key, fallback = mapping.get(key, (None, default))
+        cache_key = (key, default)
+        try:
+            return _CACHE[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable default: resolve without caching
+            return self._resolve(key, default)
+        value = _CACHE[cache_key] = self._resolve(key, default)
+        return value
+
+    def _resolve(self, key: str, default: Any) -> Any:
+        env_key = _KEY_MAP.get(key)
         if env_key is None:
             return default
         if env_key == "MT5_TIMEOUT_SEC":
             value = os.getenv(env_key)
             if value is None:
-                return fallback if fallback is not None else 30
+                return default if default is not None else 30
+            if value.isdecimal():
+                return int(value)
             try:
                 return int(value)
             except ValueError:
@@ -34,34 +67,40 @@ class BridgeConfig:
         if env_key == "MT5_SKIP_HIST_LOG":
             value = os.getenv(env_key)
             if value is None:
-                return True if fallback is None else bool(fallback)
-            return value.lower() in {"1", "true", "yes"}
-        return os.getenv(env_key, fallback)
+                return True if default is None else bool(default)
+            return value.lower() in _TRUTHY
+        return os.getenv(env_key, default)
 
-    def get_mt5_files_directory(self) -> str:
+    def get_mt5_files_directory(self, override: Optional[str] = None) -> str:
         """Resolve the MT5 `MQL5/Files` directory.
 
         Priority:
+        - `override` argument (e.g. from the CLI)
         - MT5_FILES_DIR env var
         - examples/path.hint.txt (if present)
         - current directory
         """
-        env_path = os.getenv("MT5_FILES_DIR")
-        if env_path:
-            return env_path
-        # Use hint if provided
-        hint_file = Path("examples/path.hint.txt")
-        if hint_file.exists():
-            try:
-                content = hint_file.read_text().strip()
-                # Only accept if it's an existing directory path
-                if content and os.path.isabs(content) and os.path.isdir(content):
-                    return content
-            except Exception:
-                pass
-        return str(Path.cwd())
+        if override:
+            return override
+        return _resolve_files_dir()
+
 
+@functools.lru_cache(maxsize=1)
+def _resolve_files_dir() -> str:
+    env_path = os.getenv("MT5_FILES_DIR")
+    if env_path:
+        return env_path
+    # Use hint if provided
+    try:
+        content = Path("examples/path.hint.txt").read_bytes().decode().strip()
+    except (OSError, UnicodeDecodeError):
+        content = ""
+    # Only accept if it's an existing directory path
+    if content and os.path.isabs(content) and os.path.isdir(content):
+        return content
+    return os.getcwd()
 
+
+@functools.lru_cache(maxsize=1)
 def get_config() -> BridgeConfig:
     return BridgeConfig()
-
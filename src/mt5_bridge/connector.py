@@ -4,21 +4,196 @@ MT5 File-Based Connector for Professional Forex Trading System
 Handles all communication with MetaTrader 5 via shared JSON files.
 """
 
+import functools
+import itertools
 import json
 import os
+import sys
 import time
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import BinaryIO, Deque, Dict, Any, NamedTuple, Optional, List, Tuple
+from dataclasses import dataclass, field
+from array import array
+from collections import deque
 import threading
 
 from .config import get_config
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the 'fast' extra
+    orjson = None
+
+try:
+    from watchfiles import watch
+except ImportError:  # optional, see the 'watch' extra; falls back to polling
+    watch = None
+
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# datetime.fromtimestamp() for the datetime properties below, keyed on the timestamp
+# itself: the same ticks, positions and closed trades are converted on every poll
+_fromtimestamp = functools.lru_cache(maxsize=1024)(datetime.fromtimestamp)
+
+# Initial size of the per-thread read buffer; it grows to the largest file read
+_SCRATCH_SIZE = 64 * 1024
+
+# Block size for reading trade_results.txt backwards from its end
+_TAIL_BLOCK_SIZE = 8192
+
+# Command actions understood by the EA
+_VALID_ACTIONS = frozenset(('buy', 'sell', 'modify', 'close'))
+# Order actions that open a position (and carry a lot size and symbol)
+_ORDER_ACTIONS = frozenset(('buy', 'sell'))
+# Actions that target an existing position by ticket
+_TICKET_ACTIONS = frozenset(('modify', 'close'))
+
+# Keys each EA record must carry
+_REQUIRED_PRICE_FIELDS = frozenset(('symbol', 'bid', 'ask', 'timestamp'))
+_REQUIRED_POSITION_FIELDS = frozenset(('ticket', 'symbol', 'type', 'volume', 'price_open',
+                                       'price_current', 'profit', 'time_open_timestamp'))
+_REQUIRED_ACCOUNT_FIELDS = frozenset(('balance', 'equity', 'margin', 'free_margin', 'profit'))
+_REQUIRED_TRADE_FIELDS = frozenset(('ticket', 'symbol', 'type', 'volume', 'entry_price',
+                                    'exit_price', 'profit', 'change_percent', 'close_time', 'close_timestamp'))
+
+
+def _intern(value: Any) -> Any:
+    """
+    sys.intern() for str values; anything else (e.g. a null symbol) is returned as is
+
+    symbol/type/action/result take a handful of values, so rows share one str each.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@functools.lru_cache(maxsize=16)
+def _price_file_candidates(base_symbol: str) -> Tuple[str, ...]:
+    """Price file names to try for a symbol, most specific first (deduplicated)"""
+    candidates: List[str] = []
+    # Start with provided base
+    candidates.append(f"{base_symbol}_price.json")
+    # If missing broker suffix, try a common variant like '!'
+    if '!' not in base_symbol:
+        candidates.append(f"{base_symbol}!_price.json")
+    else:
+        # If base has '!' try without it
+        candidates.append(f"{base_symbol.replace('!','')}_price.json")
+    # Specific fallback for gold
+    if base_symbol != 'XAUUSD':
+        candidates.append("XAUUSD_price.json")
+        candidates.append("XAUUSD!_price.json")
+    return tuple(dict.fromkeys(candidates))
+
+
+def _try_stat(path: str) -> Optional[os.stat_result]:
+    """os.stat() that returns None for a missing file (one syscall instead of exists + stat)"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_log_time(timestamp: str) -> str:
+    """
+    '2025.07.31 18:56' -> '07/31 18:56' (the input unchanged if it does not parse)
+
+    Cached: the log has minute resolution and the same tail is re-read every
+    poll, so strptime runs about once per distinct minute.
+    """
+    try:
+        return datetime.strptime(timestamp, '%Y.%m.%d %H:%M').strftime('%m/%d %H:%M')
+    except Exception:
+        return timestamp
+
+
+def _tail_lines(path: str, n: int) -> List[bytes]:
+    """
+    Return the last n lines of a file, oldest first, without their newlines
+
+    Reads backwards from the end in _TAIL_BLOCK_SIZE blocks and stops once
+    n complete lines are in hand. Returns every line if n <= 0.
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        if n <= 0:
+            f.seek(0)
+            chunks = [f.read()]
+        else:
+            chunks = []
+            newlines = 0
+            # n + 1 newlines guarantee n whole lines even when the file ends with one
+            while pos > 0 and newlines <= n:
+                step = min(_TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b'\n')
+            chunks.reverse()
+    lines = b''.join(chunks).split(b'\n')
+    if not lines[-1]:
+        lines.pop()
+    return lines[-n:] if n > 0 else lines
+
+
+# Per-thread read buffer, reused across polls instead of a new bytes per read
+_scratch = threading.local()
+
+
+def _scratch_buffer(size: int) -> bytearray:
+    buf = getattr(_scratch, 'buf', None)
+    if buf is None or len(buf) < size:
+        buf = _scratch.buf = bytearray(max(size, _SCRATCH_SIZE))
+    return buf
+
+
+def _read_json_file(path: str) -> Any:
+    """
+    Parse a JSON file with plain reads
 
-@dataclass
+    The EA truncates and rewrites its files in place, so a read can see a
+    partial file; that surfaces as a JSONDecodeError for the caller to handle.
+    (Memory-mapping the file would turn the same race into SIGBUS.)
+    """
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        # One spare byte so a file that grew since fstat() fills the buffer
+        buf = _scratch_buffer(os.fstat(f.fileno()).st_size + 1)
+        n = f.readinto(buf)
+        if n == len(buf):
+            # File grew past the buffer since fstat(): read the remainder normally
+            return orjson.loads(bytes(buf) + f.read())
+        with memoryview(buf) as view:
+            return orjson.loads(view[:n])
+
+
+def _dataclass_fields(obj: Any) -> Dict[str, Any]:
+    """Shallow field dict of a flat dataclass (no asdict() recursion/deepcopy)"""
+    if hasattr(obj, '__dataclass_fields__'):
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize to compact, ASCII-only JSON (the EA reads command files as ANSI)
+
+    Dataclass instances are serialized field by field in declaration order.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj)
+        # orjson always emits UTF-8; escape non-ASCII text the way json does
+        if data.isascii():
+            return data
+    return json.dumps(obj, separators=(',', ':'), default=_dataclass_fields).encode('ascii')
+
+
+@dataclass(frozen=True, **_SLOTS)
 class MarketData:
     """Market data structure"""
     symbol: str
@@ -44,10 +219,10 @@ class MarketData:
     @property
     def datetime(self) -> datetime:
         """Convert timestamp to datetime"""
-        return datetime.fromtimestamp(self.timestamp)
+        return _fromtimestamp(self.timestamp)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AccountInfo:
     """Account information structure"""
     balance: float
@@ -73,7 +248,7 @@ class AccountInfo:
         return (self.equity / self.margin) * 100
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TradeCommand:
     """Trade command structure"""
     action: str  # 'buy', 'sell', 'modify', or 'close'
@@ -92,7 +267,7 @@ class TradeCommand:
             self.timestamp = int(time.time())
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModifyCommand:
     """Position modification command"""
     action: str = "modify"
@@ -103,7 +278,7 @@ class ModifyCommand:
     timestamp: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CloseCommand:
     """Position close command"""
     action: str = "close"
@@ -113,7 +288,7 @@ class CloseCommand:
     timestamp: int = field(default_factory=lambda: int(time.time()))
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Position:
     """Open position structure"""
     ticket: int
@@ -134,7 +309,7 @@ class Position:
     @property
     def open_datetime(self) -> datetime:
         """Convert open timestamp to datetime"""
-        return datetime.fromtimestamp(self.time_open_timestamp)
+        return _fromtimestamp(self.time_open_timestamp)
 
     @property
     def formatted_profit(self) -> str:
@@ -147,7 +322,27 @@ class Position:
         return self.profit + self.swap
 
 
-@dataclass
+def _position_from_dict(pos_data: Dict[str, Any]) -> Position:
+    """Build a Position from one positions.json entry (positional construction)"""
+    return Position(
+        int(pos_data['ticket']),
+        _intern(pos_data['symbol']),
+        _intern(pos_data['type']),
+        float(pos_data['volume']),
+        float(pos_data['price_open']),
+        float(pos_data['price_current']),
+        float(pos_data.get('sl', 0)),
+        float(pos_data.get('tp', 0)),
+        float(pos_data['profit']),
+        float(pos_data.get('swap', 0)),
+        int(pos_data.get('magic', 0)),
+        pos_data.get('comment', ''),
+        pos_data['time_open'],
+        int(pos_data['time_open_timestamp']),
+    )
+
+
+@dataclass(**_SLOTS)
 class TradeResult:
     """Trade execution result"""
     action: str
@@ -161,7 +356,7 @@ class TradeResult:
     ticket: Optional[int] = None  # For modify/close results
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ClosedTrade:
     """Closed trade data structure"""
     ticket: int
@@ -180,7 +375,7 @@ class ClosedTrade:
     @property
     def close_datetime(self) -> datetime:
         """Convert close timestamp to datetime"""
-        return datetime.fromtimestamp(self.close_timestamp)
+        return _fromtimestamp(self.close_timestamp)
 
     @property
     def formatted_profit(self) -> str:
@@ -193,22 +388,141 @@ class ClosedTrade:
         return f"{self.change_percent:+.2f}%"
 
 
+def _closed_trade_from_dict(trade_data: Dict[str, Any]) -> ClosedTrade:
+    """Build a ClosedTrade from one closed_trades.json entry (positional construction)"""
+    return ClosedTrade(
+        int(trade_data['ticket']),
+        _intern(trade_data['symbol']),
+        _intern(trade_data['type']),
+        float(trade_data['volume']),
+        float(trade_data['entry_price']),
+        float(trade_data['exit_price']),
+        float(trade_data.get('sl', 0)),
+        float(trade_data.get('tp', 0)),
+        float(trade_data['profit']),
+        float(trade_data['change_percent']),
+        trade_data['close_time'],
+        int(trade_data['close_timestamp']),
+    )
+
+
+# ClosedTrade fields in column form: array typecode, or None for a list of str
+_CLOSED_TRADE_COLUMNS = (
+    ('ticket', 'q'),
+    ('symbol', None),
+    ('type', None),
+    ('volume', 'd'),
+    ('entry_price', 'd'),
+    ('exit_price', 'd'),
+    ('sl', 'd'),
+    ('tp', 'd'),
+    ('profit', 'd'),
+    ('change_percent', 'd'),
+    ('close_time', None),
+    ('close_timestamp', 'q'),
+)
+
+
+def _closed_trade_columns(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Transpose validated closed_trades.json entries into one column per field"""
+    columns: Dict[str, Any] = {}
+    for name, typecode in _CLOSED_TRADE_COLUMNS:
+        # Only sl/tp are optional; the other fields were checked by the caller
+        values = [row.get(name, 0) for row in rows]
+        if typecode == 'd':
+            columns[name] = array('d', map(float, values))
+        elif typecode == 'q':
+            columns[name] = array('q', map(int, values))
+        else:
+            columns[name] = values if name == 'close_time' else list(map(_intern, values))
+    return columns
+
+
+class _PriceColumns:
+    """Fixed-capacity ring buffer of bid/ask/timestamp stored column-wise
+
+    Each column is a contiguous `array.array`, so analytics code can scan one
+    field without touching MarketData objects (and can wrap it with
+    `numpy.frombuffer` without copying).
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.bid = array('d', [0.0]) * capacity
+        self.ask = array('d', [0.0]) * capacity
+        self.timestamp = array('q', [0]) * capacity
+        self.head = 0  # next write index
+        self.size = 0
+
+    def append(self, bid: float, ask: float, timestamp: int) -> None:
+        i = self.head
+        self.bid[i] = bid
+        self.ask[i] = ask
+        self.timestamp[i] = timestamp
+        self.head = (i + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def tail(self, limit: int) -> Dict[str, array]:
+        """Newest `limit` rows (all rows if limit <= 0), oldest first"""
+        n = self.size if limit <= 0 else min(limit, self.size)
+        start = (self.head - n) % self.capacity
+        end = start + n
+        columns = {'bid': self.bid, 'ask': self.ask, 'timestamp': self.timestamp}
+        if end <= self.capacity:
+            return {name: col[start:end] for name, col in columns.items()}
+        # Wrapped around: stitch the two halves back into chronological order
+        end -= self.capacity
+        return {name: col[start:] + col[:end] for name, col in columns.items()}
+
+
+class ConnectionInfo(NamedTuple):
+    """Connection status snapshot"""
+    connected: bool
+    last_price_update: Optional[datetime]
+    price_history_count: int
+    files_directory: str
+    price_file_exists: bool
+    command_file_exists: bool
+    trade_log_file_exists: bool
+    positions_file_exists: bool
+    last_heartbeat: datetime
+
+
 class ConnectionMonitor:
-    """Monitor MT5 connection health via file timestamps"""
+    """Monitor MT5 connection health via file timestamps
+
+    With the optional `watchfiles` package installed, the heartbeat is driven by
+    file-system change events (FSEvents on macOS); otherwise the price file's
+    mtime is polled.
+    """
 
     def __init__(self, price_file_path: str):
         self.price_file_path = price_file_path
         self.config = get_config()
         self.is_monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self.watch_thread: Optional[threading.Thread] = None
         self.last_heartbeat = time.time()
+        self._stop = threading.Event()
+        self._watching = False
 
     def start_monitoring(self):
         """Start connection monitoring in background thread"""
         if self.is_monitoring:
             return
 
+        # Seed the heartbeat from the price file: in watch mode it otherwise keeps the
+        # time of __init__ (or of the previous session) until the first change event
+        st = _try_stat(self.price_file_path)
+        self.last_heartbeat = st.st_mtime if st is not None else time.time()
+
         self.is_monitoring = True
+        self._stop.clear()
+        if watch is not None:
+            self._watching = True
+            self.watch_thread = threading.Thread(target=self._watch_loop, daemon=True)
+            self.watch_thread.start()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         logger.info("Connection monitoring started")
@@ -216,34 +530,60 @@ class ConnectionMonitor:
     def stop_monitoring(self):
         """Stop connection monitoring"""
         self.is_monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=5)
+        self._stop.set()
+        for thread in (self.watch_thread, self.monitor_thread):
+            if thread:
+                thread.join(timeout=5)
         logger.info("Connection monitoring stopped")
 
+    def _watch_loop(self):
+        """Refresh the heartbeat whenever the EA writes the price file"""
+        price_dir = os.path.dirname(self.price_file_path) or "."
+        price_name = os.path.basename(self.price_file_path)
+        try:
+            for _changes in watch(price_dir,
+                                  watch_filter=lambda _change, path: os.path.basename(path) == price_name,
+                                  recursive=False,
+                                  stop_event=self._stop):
+                self.last_heartbeat = time.time()
+        except Exception as e:
+            logger.warning(f"File watcher failed, falling back to polling: {e}")
+        finally:
+            self._watching = False
+
     def _monitor_loop(self):
         """Main monitoring loop"""
         timeout = self.config.get('mt5_bridge.connection_timeout_seconds', 30)
 
         while self.is_monitoring:
             try:
-                price_file_path = self.price_file_path
-
-                if os.path.exists(price_file_path):
-                    file_mtime = os.path.getmtime(price_file_path)
-                    time_since_update = time.time() - file_mtime
-
+                if self._watching:
+                    time_since_update = time.time() - self.last_heartbeat
                     if time_since_update > timeout:
                         logger.warning(f"No price updates for {time_since_update:.1f} seconds")
-                    else:
-                        self.last_heartbeat = time.time()
                 else:
-                    logger.warning("Price file does not exist")
+                    self._poll_price_file(timeout)
 
-                time.sleep(5)
+                self._stop.wait(5)
 
             except Exception as e:
                 logger.error(f"Error in connection monitoring: {e}")
-                time.sleep(10)
+                self._stop.wait(10)
+
+    def _poll_price_file(self, timeout: float) -> None:
+        """Heartbeat from the price file's mtime (used without a file watcher)"""
+        price_file_path = self.price_file_path
+
+        st = _try_stat(price_file_path)
+        if st is not None:
+            time_since_update = time.time() - st.st_mtime
+
+            if time_since_update > timeout:
+                logger.warning(f"No price updates for {time_since_update:.1f} seconds")
+            else:
+                self.last_heartbeat = time.time()
+        else:
+            logger.warning("Price file does not exist")
 
 
 class MT5Connector:
@@ -252,19 +592,41 @@ class MT5Connector:
     Handles all communication with MetaTrader 5 via shared JSON files.
     """
 
-    def __init__(self):
-        """Initialize MT5 connector"""
+    def __init__(self, files_dir: Optional[str] = None, primary_symbol: Optional[str] = None):
+        """
+        Initialize MT5 connector
+
+        Args:
+            files_dir: MT5 MQL5/Files directory (overrides MT5_FILES_DIR)
+            primary_symbol: Primary symbol (overrides MT5_PRIMARY_SYMBOL)
+        """
         self.config = get_config()
         self.connection_status = False
         self.last_price_data = None
-        self.price_history: List[MarketData] = []
+        # (mtime_ns, size) of the price file when last_price_data was parsed
+        self._price_stat: Optional[Tuple[int, int]] = None
+        # path -> ((mtime_ns, size), parsed JSON) for the other EA files
+        self._stat_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # (parsed account_info.json, AccountInfo built from it)
+        self._account_info_cache: Optional[Tuple[Any, AccountInfo]] = None
+        # Objects built from the last positions.json / closed_trades.json parse (and limit)
+        self._positions_cache: Optional[Tuple[Any, Tuple[Position, ...]]] = None
+        self._closed_trades_cache: Optional[Tuple[Any, int, Tuple[ClosedTrade, ...]]] = None
+        self.price_history: Deque[MarketData] = deque(maxlen=1000)
+        self._price_columns = _PriceColumns(1000)
         self.trade_log_position = 0
+        # Long-lived handle on trade_results.txt and the (st_dev, st_ino) it was opened on
+        self._trade_log_fh: Optional[BinaryIO] = None
+        self._trade_log_id: Optional[Tuple[int, int]] = None
+        # Last order symbol that was rewritten to the broker symbol (for log de-duplication)
+        self._last_normalized_symbol: Optional[str] = None
 
         # File paths
-        configured_dir = self.config.get_mt5_files_directory()
+        configured_dir = self.config.get_mt5_files_directory(files_dir)
 
         # Determine primary symbol (used for tick/orderbook filenames). Fallback to XAUUSD.
-        self.symbol = self.config.get('trading.primary_symbol', 'XAUUSD')
+        self._configured_symbol = primary_symbol or self.config.get('trading.primary_symbol', 'XAUUSD')
+        self.symbol = self._configured_symbol
 
         # Respect config for price file if provided; otherwise build from symbol.
         price_file_from_cfg = self.config.get('mt5_bridge.price_file', None)
@@ -297,6 +659,9 @@ class MT5Connector:
         self.account_info_file_path = os.path.join(self.files_dir, "account_info.json")
         self.closed_trades_file_path = os.path.join(self.files_dir, "closed_trades.json")
         self.positions_file_path = os.path.join(self.files_dir, "positions.json")
+        self.symbol_info_file_path = os.path.join(self.files_dir, "symbol_info.json")
+        self.orders_file_path = os.path.join(self.files_dir, "orders.json")
+        self.rates_m1_file_path = os.path.join(self.files_dir, "rates_M1.json")
 
         # Connection monitoring
         self.monitor = ConnectionMonitor(self.price_file_path)
@@ -309,7 +674,11 @@ class MT5Connector:
                 if latest_symbol:
                     self.symbol = latest_symbol
         except Exception as _e:
-            logger.debug(f"prefer_latest check skipped: {_e}")
+            logger.debug("prefer_latest check skipped: %s", _e)
+
+        # Per-symbol exports, named after the final resolved symbol
+        self.tick_file_path = os.path.join(self.files_dir, f"{self.symbol}_tick.json")
+        self.orderbook_file_path = os.path.join(self.files_dir, f"{self.symbol}_orderbook.json")
 
         logger.info("MT5 Connector initialized")
         logger.info(f"Price file: {self.price_file_path}")
@@ -331,14 +700,22 @@ class MT5Connector:
         try:
             logger.info("Connecting to MT5...")
 
-            # Check if MT5 files directory exists
-            mt5_dir = getattr(self, 'files_dir', self.config.get_mt5_files_directory())
-            if not os.path.exists(mt5_dir):
+            # Check if MT5 files directory exists; one listing answers the file probes below too
+            mt5_dir = self.files_dir
+            try:
+                with os.scandir(mt5_dir) as it:
+                    entries = {e.name: e for e in it}
+            except OSError:
                 logger.error(f"MT5 files directory not found: {mt5_dir}")
                 return False
 
             # Test price file access
-            if os.path.exists(self.price_file_path):
+            price_dir, price_name = os.path.split(self.price_file_path)
+            if price_dir == mt5_dir:
+                price_file_exists = price_name in entries
+            else:
+                price_file_exists = os.path.exists(self.price_file_path)
+            if price_file_exists:
                 test_data = self.get_market_data()
                 if test_data:
                     logger.info(f"✅ Price data available: {test_data.symbol} @ {test_data.bid}")
@@ -354,8 +731,9 @@ class MT5Connector:
             # Optionally skip historical trade log on first connect to avoid flooding
             try:
                 skip_hist = self.config.get('mt5_bridge.skip_historical_trade_log_on_connect', True)
-                if skip_hist and os.path.exists(self.trade_log_file_path):
-                    self.trade_log_position = os.path.getsize(self.trade_log_file_path)
+                trade_log_entry = entries.get(os.path.basename(self.trade_log_file_path)) if skip_hist else None
+                if trade_log_entry is not None:
+                    self.trade_log_position = trade_log_entry.stat().st_size
                     logger.info("Trade log set to EOF to skip historical entries on connect")
             except Exception as e:
                 logger.debug(f"Unable to set trade log to EOF: {e}")
@@ -372,6 +750,7 @@ class MT5Connector:
         logger.info("Disconnecting from MT5...")
 
         self.monitor.stop_monitoring()
+        self._close_trade_log()
         self.connection_status = False
 
         logger.info("MT5 disconnected")
@@ -393,31 +772,47 @@ class MT5Connector:
             MarketData object or None if error
         """
         try:
-            if not os.path.exists(self.price_file_path):
+            st = _try_stat(self.price_file_path)
+            if st is None:
                 logger.debug("Price file does not exist")
                 return None
 
-            with open(self.price_file_path, 'r') as f:
-                data = json.load(f)
+            # Unchanged since the last successful parse: reuse it
+            price_stat = (st.st_mtime_ns, st.st_size)
+            if price_stat == self._price_stat and self.last_price_data is not None:
+                return self.last_price_data
+
+            data = _read_json_file(self.price_file_path)
 
             # Validate required fields
-            required_fields = ['symbol', 'bid', 'ask', 'timestamp']
-            if not all(field in data for field in required_fields):
+            if not _REQUIRED_PRICE_FIELDS.issubset(data):
                 logger.warning("Price data missing required fields")
                 return None
 
+            bid = float(data['bid'])
+            ask = float(data['ask'])
+            timestamp = int(data['timestamp'])
+
+            # EA re-flushed the same tick: keep the existing object, don't grow history
+            last = self.last_price_data
+            if (last is not None and last.timestamp == timestamp and last.bid == bid
+                    and last.ask == ask and last.symbol == data['symbol']):
+                self._price_stat = price_stat
+                return last
+
             market_data = MarketData(
                 symbol=data['symbol'],
-                bid=float(data['bid']),
-                ask=float(data['ask']),
+                bid=bid,
+                ask=ask,
                 spread=float(data.get('spread', data['ask'] - data['bid'])),
                 volume=int(data.get('volume', 0)),
-                timestamp=int(data['timestamp']),
+                timestamp=timestamp,
                 server_time=data.get('server_time', '')
             )
 
             # Update last price and history
             self.last_price_data = market_data
+            self._price_stat = price_stat
             self._update_price_history(market_data)
 
             return market_data
@@ -435,37 +830,27 @@ class MT5Connector:
         Returns (resolved_path, resolved_symbol) or (None, None) if not found.
         """
         try:
-            candidates: List[str] = []
-            # Start with provided base
-            candidates.append(f"{base_symbol}_price.json")
-            # If missing broker suffix, try a common variant like '!'
-            if '!' not in base_symbol:
-                candidates.append(f"{base_symbol}!_price.json")
-            else:
-                # If base has '!' try without it
-                candidates.append(f"{base_symbol.replace('!','')}_price.json")
-            # Specific fallback for gold
-            if base_symbol != 'XAUUSD':
-                candidates.append("XAUUSD_price.json")
-                candidates.append("XAUUSD!_price.json")
+            candidates = _price_file_candidates(base_symbol)
+
+            # One directory pass: name -> path of every *_price.json (in directory order)
+            with os.scandir(mt5_dir) as it:
+                price_files = {e.name: e.path for e in it if e.name.endswith("_price.json")}
 
             # Check candidate files in order
             for fname in candidates:
-                path = os.path.join(mt5_dir, fname)
-                if os.path.exists(path):
+                path = price_files.get(fname)
+                if path:
                     resolved_symbol = fname.replace("_price.json", "")
                     logger.info(f"Auto-resolved price file: {path} (symbol {resolved_symbol})")
                     return path, resolved_symbol
 
-            # As a last resort, scan for any *_price.json
-            for fname in os.listdir(mt5_dir):
-                if fname.endswith("_price.json"):
-                    path = os.path.join(mt5_dir, fname)
-                    resolved_symbol = fname.replace("_price.json", "")
-                    logger.info(f"Auto-resolved by scan: {path} (symbol {resolved_symbol})")
-                    return path, resolved_symbol
+            # As a last resort, take any *_price.json
+            for fname, path in price_files.items():
+                resolved_symbol = fname.replace("_price.json", "")
+                logger.info(f"Auto-resolved by scan: {path} (symbol {resolved_symbol})")
+                return path, resolved_symbol
         except Exception as e:
-            logger.debug(f"Auto-resolve price file failed: {e}")
+            logger.debug("Auto-resolve price file failed: %s", e)
         return None, None
 
     def _prefer_latest_price_file(self, mt5_dir: str, base_symbol: str) -> Tuple[Optional[str], Optional[str]]:
@@ -474,35 +859,19 @@ class MT5Connector:
         Returns (path, symbol) or (None, None) if nothing found.
         """
         try:
-            candidates: List[str] = []
-            candidates.append(f"{base_symbol}_price.json")
-            if '!' not in base_symbol:
-                candidates.append(f"{base_symbol}!_price.json")
-            else:
-                candidates.append(f"{base_symbol.replace('!','')}_price.json")
-            if base_symbol != 'XAUUSD':
-                candidates.append("XAUUSD_price.json")
-                candidates.append("XAUUSD!_price.json")
+            candidates = _price_file_candidates(base_symbol)
+            with os.scandir(mt5_dir) as it:
+                price_entries = [e for e in it if e.name.endswith("_price.json")]
+            wanted = set(candidates)
+            # Prefer candidate names; if none exist, pick the newest of any *_price.json
+            entries = [e for e in price_entries if e.name in wanted] or price_entries
 
             existing: List[Tuple[float, str]] = []
-            for fname in candidates:
-                path = os.path.join(mt5_dir, fname)
-                if os.path.exists(path):
-                    try:
-                        mtime = os.path.getmtime(path)
-                        existing.append((mtime, path))
-                    except Exception:
-                        pass
-            # If no candidate existed, scan for any *_price.json and pick newest
-            if not existing:
-                for fname in os.listdir(mt5_dir):
-                    if fname.endswith("_price.json"):
-                        path = os.path.join(mt5_dir, fname)
-                        try:
-                            mtime = os.path.getmtime(path)
-                            existing.append((mtime, path))
-                        except Exception:
-                            pass
+            for entry in entries:
+                try:
+                    existing.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    pass
             if not existing:
                 return None, None
             existing.sort(reverse=True)
@@ -510,7 +879,7 @@ class MT5Connector:
             best_symbol = os.path.basename(best_path).replace("_price.json", "")
             return best_path, best_symbol
         except Exception as e:
-            logger.debug(f"prefer_latest failed: {e}")
+            logger.debug("prefer_latest failed: %s", e)
             return None, None
 
     def _auto_resolve_files_dir_and_symbol(self, base_symbol: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -539,12 +908,9 @@ class MT5Connector:
 
     def _update_price_history(self, market_data: MarketData) -> None:
         """Update price history with new data"""
-        # Add to history
+        # Add to history (the deque keeps only the last 1000 records)
         self.price_history.append(market_data)
-
-        # Keep only last 1000 records
-        if len(self.price_history) > 1000:
-            self.price_history = self.price_history[-1000:]
+        self._price_columns.append(market_data.bid, market_data.ask, market_data.timestamp)
 
     def get_price_history(self, limit: int = 100) -> List[MarketData]:
         """
@@ -556,24 +922,65 @@ class MT5Connector:
         Returns:
             List of MarketData objects
         """
-        return self.price_history[-limit:]
+        history = self.price_history
+        if 0 < limit < len(history):
+            # Walk back from the newest entry instead of copying the whole deque
+            return list(itertools.islice(reversed(history), limit))[::-1]
+        return list(history)[-limit:]
 
-    def _write_command(self, command_dict: Dict[str, Any]) -> bool:
+    def get_history_arrays(self, limit: int = 100) -> Dict[str, array]:
+        """
+        Get recent price history as columns
+
+        Args:
+            limit: Maximum number of records to return (all if <= 0)
+
+        Returns:
+            Dict with 'bid', 'ask' (array of double) and 'timestamp' (array of int64),
+            oldest first
+        """
+        return self._price_columns.tail(limit)
+
+    def _cached_json(self, path: str) -> Any:
+        """
+        Parse a JSON file written by the EA, reusing the last result while the
+        file's (mtime_ns, size) is unchanged
+
+        The returned object is shared between calls; copy it before mutating.
+        Raises FileNotFoundError if the file does not exist.
+        """
+        st = _try_stat(path)
+        if st is None:
+            self._stat_cache.pop(path, None)
+            raise FileNotFoundError(path)
+        key = (st.st_mtime_ns, st.st_size)
+        hit = self._stat_cache.get(path)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        obj = _read_json_file(path)
+        self._stat_cache[path] = (key, obj)
+        return obj
+
+    def _write_command(self, command: Any) -> bool:
         """
         Write command to MT5 command file
 
         Args:
-            command_dict: Dictionary containing command data
+            command: Command dataclass (TradeCommand, ModifyCommand, CloseCommand)
 
         Returns:
             True if command written successfully, False otherwise
         """
         try:
-            # Write command to file (compact JSON format for EA compatibility)
-            with open(self.command_file_path, 'w') as f:
-                json.dump(command_dict, f, separators=(',', ':'))
-
-            logger.info(f"➡️ Command sent: {command_dict.get('action', 'unknown').upper()}")
+            # Write command to file (compact JSON format for EA compatibility).
+            # Written to a sibling temp file and renamed into place so the EA,
+            # which polls commands.json, never sees a truncated or half-written command.
+            tmp_path = self.command_file_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dump_json(command))
+            os.replace(tmp_path, self.command_file_path)
+
+            logger.info(f"➡️ Command sent: {getattr(command, 'action', 'unknown').upper()}")
             return True
 
         except Exception as e:
@@ -592,32 +999,31 @@ class MT5Connector:
         """
         try:
             # Validate command
-            if command.action not in ['buy', 'sell', 'modify', 'close']:
-                logger.error(f"Invalid trade action: {command.action}")
+            action = command.action
+            if action not in _VALID_ACTIONS:
+                logger.error(f"Invalid trade action: {action}")
                 return False
 
-            if command.action in ['buy', 'sell'] and command.lot_size <= 0:
+            is_order = action in _ORDER_ACTIONS
+            if is_order and command.lot_size <= 0:
                 logger.error(f"Invalid lot size: {command.lot_size}")
                 return False
 
-            if command.action in ['modify', 'close'] and not command.ticket:
-                logger.error(f"Ticket required for {command.action} command")
+            if not is_order and not command.ticket:
+                logger.error(f"Ticket required for {action} command")
                 return False
 
             # Normalize symbol to resolved primary symbol for this broker (prevents XAUUSD vs XAUUSD! mismatch)
-            try:
-                if command.action in ['buy', 'sell']:
-                    broker_symbol = getattr(self, 'symbol', None)
-                    if broker_symbol and command.symbol != broker_symbol:
+            if is_order:
+                broker_symbol = self.symbol
+                if broker_symbol and command.symbol != broker_symbol:
+                    # Log once per distinct input symbol rather than on every order
+                    if command.symbol != self._last_normalized_symbol:
                         logger.info(f"Normalizing trade symbol: {command.symbol} -> {broker_symbol}")
-                        command.symbol = broker_symbol
-            except Exception:
-                pass
-
-            # Convert to dictionary
-            command_dict = asdict(command)
+                        self._last_normalized_symbol = command.symbol
+                    command.symbol = broker_symbol
 
-            return self._write_command(command_dict)
+            return self._write_command(command)
 
         except Exception as e:
             logger.error(f"Error sending trade command: {e}")
@@ -706,8 +1112,7 @@ class MT5Connector:
             comment=comment
         )
 
-        command_dict = asdict(command)
-        return self._write_command(command_dict)
+        return self._write_command(command)
 
     def close_position(self, ticket: int, comment: str = "", volume: Optional[float] = None) -> bool:
         """
@@ -727,8 +1132,7 @@ class MT5Connector:
             close_volume=volume
         )
 
-        command_dict = asdict(command)
-        return self._write_command(command_dict)
+        return self._write_command(command)
 
     def get_trade_results(self) -> List[TradeResult]:
         """
@@ -738,60 +1142,41 @@ class MT5Connector:
             List of TradeResult objects
         """
         try:
-            if not os.path.exists(self.trade_log_file_path):
-                return []
             results = []
-            with open(self.trade_log_file_path, 'r') as f:
-                f.seek(self.trade_log_position)
-                new_lines = f.readlines()
-                self.trade_log_position = f.tell()
-            for line in new_lines:
+            f = self._trade_log_handle()
+            if f is None:
+                return []
+            f.seek(self.trade_log_position)
+            blob = f.read()
+            self.trade_log_position += len(blob)
+            primary_symbol = self._configured_symbol
+            for line in blob.decode('utf-8', 'replace').splitlines():
                 line = line.strip()
                 if not line:
                     continue
                 try:
                     # Parse log line format: "2025.07.29 17:05 | action | SUCCESS | details | XAUUSD | trade_id"
-                    parts = line.split(' | ')
+                    parts = [part.strip() for part in line.split(' | ', 6)]
                     if len(parts) >= 6:
-                        timestamp = parts[0].strip()
-                        action = parts[1].strip()
-                        result = parts[2].strip()
-                        details = parts[3].strip()
-                        symbol = parts[4].strip()
-                        trade_id = parts[5].strip()
-
-                        trade_result = TradeResult(
-                            action=action,
-                            symbol=symbol,
-                            result=result,
-                            timestamp=timestamp,
-                            order_id=None,
-                            price=None,
-                            error_message=None,
-                            trade_id=trade_id
-                        )
+                        timestamp, action, result, details, symbol, trade_id = parts[:6]
 
                         # Parse ticket from details for modify/close actions
-                        if action in ['modify', 'close'] and 'ticket:' in details:
-                            try:
-                                ticket_str = details.split('ticket:')[1].strip()
-                                trade_result.ticket = int(ticket_str)
-                            except (ValueError, IndexError):
-                                pass
-
-                        results.append(trade_result)
+                        ticket = None
+                        if action in _TICKET_ACTIONS:
+                            _, found, ticket_str = details.partition('ticket:')
+                            if found:
+                                try:
+                                    ticket = int(ticket_str)
+                                except ValueError:
+                                    pass
+
+                        # Positional: action, symbol, result, timestamp, order_id, price, error_message, trade_id, ticket
+                        results.append(TradeResult(_intern(action), _intern(symbol), _intern(result), timestamp,
+                                                   None, None, None, trade_id, ticket))
                     elif len(parts) >= 3:
                         # Fallback for old format
-                        timestamp = parts[0].strip()
-                        action = parts[1].strip()
-                        result = parts[2].strip()
-                        trade_result = TradeResult(
-                            action=action,
-                            symbol=self.config.get('trading.primary_symbol', 'XAUUSD'),
-                            result=result,
-                            timestamp=timestamp
-                        )
-                        results.append(trade_result)
+                        timestamp, action, result = parts[:3]
+                        results.append(TradeResult(_intern(action), primary_symbol, _intern(result), timestamp))
                 except Exception as e:
                     logger.warning(f"Error parsing trade log line '{line}': {e}")
                     continue
@@ -800,6 +1185,44 @@ class MT5Connector:
             logger.error(f"Error reading trade results: {e}")
             return []
 
+    def _trade_log_handle(self) -> Optional[BinaryIO]:
+        """
+        Return an open handle on the trade log, tail -f style
+
+        The handle is kept across calls and reopened if the EA replaces the file;
+        after a replacement or truncation reading restarts from the beginning.
+
+        Returns:
+            File handle positioned anywhere, or None if there is nothing new to read
+        """
+        st = _try_stat(self.trade_log_file_path)
+        if st is None:
+            # Whatever appears next is a new log
+            self._close_trade_log()
+            self.trade_log_position = 0
+            return None
+        file_id = (st.st_dev, st.st_ino)
+        if self._trade_log_fh is None or file_id != self._trade_log_id:
+            if self._trade_log_id is not None:
+                logger.info("Trade log replaced; reading from the beginning")
+                self.trade_log_position = 0
+            self._close_trade_log()
+            self._trade_log_fh = open(self.trade_log_file_path, 'rb')
+            self._trade_log_id = file_id
+        if st.st_size < self.trade_log_position:
+            logger.info("Trade log shrank; reading from the beginning")
+            self.trade_log_position = 0
+        if st.st_size == self.trade_log_position:
+            return None
+        return self._trade_log_fh
+
+    def _close_trade_log(self) -> None:
+        """Close the long-lived trade log handle, if open"""
+        if self._trade_log_fh is not None:
+            self._trade_log_fh.close()
+            self._trade_log_fh = None
+            self._trade_log_id = None
+
     def get_positions(self) -> List[Position]:
         """
         Get current open positions from MT5
@@ -808,53 +1231,41 @@ class MT5Connector:
             List of Position objects
         """
         try:
-            if not os.path.exists(self.positions_file_path):
+            try:
+                data = self._cached_json(self.positions_file_path)
+            except FileNotFoundError:
                 logger.debug("Positions file does not exist")
                 return []
 
-            with open(self.positions_file_path, 'r') as f:
-                data = json.load(f)
+            cached = self._positions_cache
+            if cached is not None and cached[0] is data:
+                # File unchanged: hand out the same (frozen) Position objects
+                return list(cached[1])
 
             # Check if data has the expected structure
             if 'positions' not in data:
                 logger.warning("Positions file missing 'positions' field")
                 return []
 
-            positions = []
-            for pos_data in data['positions']:
-                try:
-                    # Validate required fields
-                    required_fields = ['ticket', 'symbol', 'type', 'volume', 'price_open',
-                                       'price_current', 'profit', 'time_open_timestamp']
-
-                    if not all(field in pos_data for field in required_fields):
-                        logger.warning(f"Position data missing required fields: {pos_data}")
-                        continue
-
-                    position = Position(
-                        ticket=int(pos_data['ticket']),
-                        symbol=pos_data['symbol'],
-                        type=pos_data['type'],
-                        volume=float(pos_data['volume']),
-                        price_open=float(pos_data['price_open']),
-                        price_current=float(pos_data['price_current']),
-                        sl=float(pos_data.get('sl', 0)),
-                        tp=float(pos_data.get('tp', 0)),
-                        profit=float(pos_data['profit']),
-                        swap=float(pos_data.get('swap', 0)),
-                        magic=int(pos_data.get('magic', 0)),
-                        comment=pos_data.get('comment', ''),
-                        time_open=pos_data['time_open'],
-                        time_open_timestamp=int(pos_data['time_open_timestamp'])
-                    )
-
-                    positions.append(position)
-
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Error parsing position data: {e}")
-                    continue
+            # Validate required fields
+            raw_positions = data['positions']
+            valid = [pos_data for pos_data in raw_positions if _REQUIRED_POSITION_FIELDS.issubset(pos_data)]
+            if len(valid) != len(raw_positions):
+                logger.warning(f"Skipped {len(raw_positions) - len(valid)} positions missing required fields")
+
+            try:
+                positions = [_position_from_dict(pos_data) for pos_data in valid]
+            except (ValueError, KeyError):
+                # Rebuild one by one so only the malformed entries are dropped
+                positions = []
+                for pos_data in valid:
+                    try:
+                        positions.append(_position_from_dict(pos_data))
+                    except (ValueError, KeyError) as e:
+                        logger.warning(f"Error parsing position data: {e}")
 
-            logger.debug(f"Retrieved {len(positions)} open positions")
+            self._positions_cache = (data, tuple(positions))
+            logger.debug("Retrieved %d open positions", len(positions))
             return positions
 
         except (json.JSONDecodeError, KeyError) as e:
@@ -875,18 +1286,19 @@ class MT5Connector:
             List of trade dictionaries with historical data
         """
         try:
-            history_file = os.path.join(getattr(self, 'files_dir', self.config.get_mt5_files_directory()), "trade_results.txt")
+            history_file = self.trade_log_file_path
 
             if not os.path.exists(history_file):
                 logger.debug("Trade results file does not exist")
                 return []
 
             trades = []
-            with open(history_file, 'r') as f:
-                lines = f.readlines()
+            # The log grows for the lifetime of the EA; read only its last `limit` lines
+            # and decode them in one call rather than line by line
+            lines = b'\n'.join(_tail_lines(history_file, limit)).decode('utf-8', 'replace').split('\n')
 
             # Parse each line (format: "2025.07.31 18:56 | sell | SUCCESS | 0.02 | XAUUSD | trade_id")
-            for line in reversed(lines[-limit:]):  # Get most recent trades first
+            for line in reversed(lines):  # Get most recent trades first
                 line = line.strip()
                 if not line or line.startswith('#'):
                     continue
@@ -894,27 +1306,20 @@ class MT5Connector:
                 try:
                     parts = line.split(' | ')
                     if len(parts) >= 5:
-                        timestamp = parts[0].strip()
-                        action = parts[1].strip()
-                        result = parts[2].strip()
-                        lot_size = float(parts[3].strip())
-                        symbol = parts[4].strip()
+                        timestamp, action, result, lot_text, symbol = map(str.strip, parts[:5])
+                        lot_size = float(lot_text)
                         trade_id = parts[5].strip() if len(parts) > 5 else "N/A"
 
                         # Convert timestamp to more readable format
-                        try:
-                            dt = datetime.strptime(timestamp, '%Y.%m.%d %H:%M')
-                            formatted_time = dt.strftime('%m/%d %H:%M')
-                        except Exception:
-                            formatted_time = timestamp
+                        formatted_time = _format_log_time(timestamp)
 
                         trade = {
                             'timestamp': timestamp,
                             'formatted_time': formatted_time,
-                            'action': action,
-                            'result': result,
+                            'action': _intern(action),
+                            'result': _intern(result),
                             'lot_size': lot_size,
-                            'symbol': symbol,
+                            'symbol': _intern(symbol),
                             'trade_id': trade_id
                         }
                         trades.append(trade)
@@ -937,30 +1342,36 @@ class MT5Connector:
             AccountInfo object or None if error
         """
         try:
-            if not os.path.exists(self.account_info_file_path):
+            try:
+                data = self._cached_json(self.account_info_file_path)
+            except FileNotFoundError:
                 logger.debug("Account info file does not exist")
                 return None
 
-            with open(self.account_info_file_path, 'r') as f:
-                data = json.load(f)
+            cached = self._account_info_cache
+            if cached is not None and cached[0] is data:
+                # File unchanged since the last call: _cached_json returned the same parse
+                return cached[1]
 
             # Validate required fields
-            required_fields = ['balance', 'equity', 'margin', 'free_margin', 'profit']
-            if not all(field in data for field in required_fields):
+            if not _REQUIRED_ACCOUNT_FIELDS.issubset(data):
                 logger.warning("Account info missing required fields")
                 return None
 
             account_info = AccountInfo(
-                balance=float(data['balance']),
-                equity=float(data['equity']),
-                margin=float(data.get('margin', 0)),
-                free_margin=float(data['free_margin']),
-                profit=float(data['profit']),
-                leverage=int(data.get('leverage', 100)),
-                currency=data.get('currency', 'USD'),
-                timestamp=int(data.get('timestamp', time.time())),
-                server_time=data.get('server_time', '')
+                float(data['balance']),
+                float(data['equity']),
+                float(data.get('margin', 0)),
+                float(data['free_margin']),
+                float(data['profit']),
+                int(data.get('leverage', 100)),
+                data.get('currency', 'USD'),
+                int(data.get('timestamp', time.time())),
+                data.get('server_time', ''),
             )
+            if 'timestamp' in data:
+                # Without one, every call is stamped with the current time; don't pin it
+                self._account_info_cache = (data, account_info)
 
             return account_info
 
@@ -971,6 +1382,31 @@ class MT5Connector:
             logger.error(f"Error reading account info: {e}")
             return None
 
+    def _closed_trades_doc(self) -> Optional[Dict[str, Any]]:
+        """Parsed closed_trades.json, or None if it is missing or has no 'trades'"""
+        try:
+            data = self._cached_json(self.closed_trades_file_path)
+        except FileNotFoundError:
+            logger.debug("Closed trades file does not exist")
+            return None
+
+        # Check if data has the expected structure
+        if 'trades' not in data:
+            logger.warning("Closed trades file missing 'trades' field")
+            return None
+        return data
+
+    def _closed_trade_rows(self, data: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """Recent closed_trades.json entries that carry every required field"""
+        # Validate required fields
+        valid = []
+        for trade_data in data['trades'][:limit]:
+            if _REQUIRED_TRADE_FIELDS.issubset(trade_data):
+                valid.append(trade_data)
+            else:
+                logger.warning(f"Trade data missing required fields: {trade_data}")
+        return valid
+
     def get_closed_trades(self, limit: int = 1000) -> List[ClosedTrade]:
         """
         Get recent closed trades from MT5
@@ -982,51 +1418,29 @@ class MT5Connector:
             List of ClosedTrade objects
         """
         try:
-            if not os.path.exists(self.closed_trades_file_path):
-                logger.debug("Closed trades file does not exist")
+            data = self._closed_trades_doc()
+            if data is None:
                 return []
+            cached = self._closed_trades_cache
+            if cached is not None and cached[0] is data and cached[1] == limit:
+                # File unchanged: hand out the same (frozen) ClosedTrade objects
+                return list(cached[2])
 
-            with open(self.closed_trades_file_path, 'r') as f:
-                data = json.load(f)
-
-            # Check if data has the expected structure
-            if 'trades' not in data:
-                logger.warning("Closed trades file missing 'trades' field")
-                return []
+            valid = self._closed_trade_rows(data, limit)
 
-            trades = []
-            for trade_data in data['trades'][:limit]:
-                try:
-                    # Validate required fields
-                    required_fields = ['ticket', 'symbol', 'type', 'volume', 'entry_price',
-                                       'exit_price', 'profit', 'change_percent', 'close_time', 'close_timestamp']
-
-                    if not all(field in trade_data for field in required_fields):
-                        logger.warning(f"Trade data missing required fields: {trade_data}")
-                        continue
-
-                    closed_trade = ClosedTrade(
-                        ticket=int(trade_data['ticket']),
-                        symbol=trade_data['symbol'],
-                        type=trade_data['type'],
-                        volume=float(trade_data['volume']),
-                        entry_price=float(trade_data['entry_price']),
-                        exit_price=float(trade_data['exit_price']),
-                        sl=float(trade_data.get('sl', 0)),
-                        tp=float(trade_data.get('tp', 0)),
-                        profit=float(trade_data['profit']),
-                        change_percent=float(trade_data['change_percent']),
-                        close_time=trade_data['close_time'],
-                        close_timestamp=int(trade_data['close_timestamp'])
-                    )
-
-                    trades.append(closed_trade)
-
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Error parsing trade data: {e}")
-                    continue
+            try:
+                trades = [_closed_trade_from_dict(trade_data) for trade_data in valid]
+            except (ValueError, KeyError):
+                # Rebuild one by one so only the malformed entries are dropped
+                trades = []
+                for trade_data in valid:
+                    try:
+                        trades.append(_closed_trade_from_dict(trade_data))
+                    except (ValueError, KeyError) as e:
+                        logger.warning(f"Error parsing trade data: {e}")
 
-            logger.debug(f"Retrieved {len(trades)} closed trades")
+            self._closed_trades_cache = (data, limit, tuple(trades))
+            logger.debug("Retrieved %d closed trades", len(trades))
             return trades
 
         except (json.JSONDecodeError, KeyError) as e:
@@ -1036,24 +1450,59 @@ class MT5Connector:
             logger.error(f"Error reading closed trades: {e}")
             return []
 
-    def get_connection_info(self) -> Dict[str, Any]:
+    def get_closed_trades_soa(self, limit: int = 1000) -> Dict[str, Any]:
+        """
+        Get recent closed trades as columns, without building ClosedTrade objects
+
+        Args:
+            limit: Maximum number of trades to return
+
+        Returns:
+            Dict keyed by ClosedTrade field name: array.array columns for the numeric
+            fields ('q' for ticket and close_timestamp, 'd' for the rest) and lists
+            for symbol, type and close_time. Columns are empty if there is no data.
+        """
+        try:
+            data = self._closed_trades_doc()
+            valid = self._closed_trade_rows(data, limit) if data is not None else []
+            try:
+                return _closed_trade_columns(valid)
+            except (ValueError, KeyError):
+                # Drop the malformed entries, as get_closed_trades does
+                good = []
+                for trade_data in valid:
+                    try:
+                        _closed_trade_from_dict(trade_data)
+                    except (ValueError, KeyError) as e:
+                        logger.warning(f"Error parsing trade data: {e}")
+                    else:
+                        good.append(trade_data)
+                return _closed_trade_columns(good)
+
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Error parsing closed trades data: {e}")
+        except Exception as e:
+            logger.error(f"Error reading closed trades: {e}")
+        return _closed_trade_columns([])
+
+    def get_connection_info(self) -> ConnectionInfo:
         """
         Get connection status and statistics
 
         Returns:
-            Dictionary with connection information
+            ConnectionInfo tuple (use `._asdict()` for a dictionary)
         """
-        return {
-            'connected': self.connection_status,
-            'last_price_update': self.last_price_data.datetime if self.last_price_data else None,
-            'price_history_count': len(self.price_history),
-            'files_directory': getattr(self, 'files_dir', self.config.get_mt5_files_directory()),
-            'price_file_exists': os.path.exists(self.price_file_path),
-            'command_file_exists': os.path.exists(self.command_file_path),
-            'trade_log_file_exists': os.path.exists(self.trade_log_file_path),
-            'positions_file_exists': os.path.exists(self.positions_file_path),
-            'last_heartbeat': datetime.fromtimestamp(self.monitor.last_heartbeat)
-        }
+        return ConnectionInfo(
+            connected=self.connection_status,
+            last_price_update=self.last_price_data.datetime if self.last_price_data else None,
+            price_history_count=len(self.price_history),
+            files_directory=self.files_dir,
+            price_file_exists=os.path.exists(self.price_file_path),
+            command_file_exists=os.path.exists(self.command_file_path),
+            trade_log_file_exists=os.path.exists(self.trade_log_file_path),
+            positions_file_exists=os.path.exists(self.positions_file_path),
+            last_heartbeat=datetime.fromtimestamp(self.monitor.last_heartbeat)
+        )
 
     def clear_command_file(self) -> bool:
         """
@@ -1081,7 +1530,7 @@ class MT5Connector:
         """
         try:
             # Check files directory
-            mt5_dir = self.config.get_mt5_files_directory()
+            mt5_dir = self.files_dir
             if not os.path.exists(mt5_dir):
                 return False, f"MT5 files directory not found: {mt5_dir}"
 
@@ -1121,19 +1570,18 @@ class MT5Connector:
             Dict with enhanced tick information
         """
         try:
-            symbol = getattr(self, 'symbol', 'XAUUSD')
-            tick_file = os.path.join(getattr(self, 'files_dir', self.config.get_mt5_files_directory()), f"{symbol}_tick.json")
-
-            if os.path.exists(tick_file):
-                with open(tick_file, 'r') as f:
-                    tick_data = json.load(f)
+            tick_file = self.tick_file_path
 
-                logger.debug(f"Tick data retrieved: {tick_data}")
-                return tick_data
-            else:
+            try:
+                tick_data = self._cached_json(tick_file)
+            except FileNotFoundError:
                 logger.warning(f"Tick file not found: {tick_file}")
                 return {}
 
+            logger.debug("Tick data retrieved: %s", tick_data)
+            # Shallow copy: the parse itself stays in the (mtime, size) cache
+            return dict(tick_data)
+
         except Exception as e:
             logger.error(f"Error reading tick data: {e}")
             return {}
@@ -1146,19 +1594,17 @@ class MT5Connector:
             Dict with order book information
         """
         try:
-            symbol = getattr(self, 'symbol', 'XAUUSD')
-            orderbook_file = os.path.join(getattr(self, 'files_dir', self.config.get_mt5_files_directory()), f"{symbol}_orderbook.json")
+            orderbook_file = self.orderbook_file_path
 
-            if os.path.exists(orderbook_file):
-                with open(orderbook_file, 'r') as f:
-                    orderbook_data = json.load(f)
-
-                logger.debug(f"Order book data retrieved: {len(orderbook_data.get('levels', []))} levels")
-                return orderbook_data
-            else:
+            try:
+                orderbook_data = self._cached_json(orderbook_file)
+            except FileNotFoundError:
                 logger.warning(f"Order book file not found: {orderbook_file}")
                 return {}
 
+            logger.debug("Order book data retrieved: %d levels", len(orderbook_data.get('levels', ())))
+            return dict(orderbook_data)
+
         except Exception as e:
             logger.error(f"Error reading order book data: {e}")
             return {}
@@ -1171,18 +1617,17 @@ class MT5Connector:
             Dict with symbol specifications
         """
         try:
-            symbol_file = os.path.join(getattr(self, 'files_dir', self.config.get_mt5_files_directory()), "symbol_info.json")
-
-            if os.path.exists(symbol_file):
-                with open(symbol_file, 'r') as f:
-                    symbol_data = json.load(f)
+            symbol_file = self.symbol_info_file_path
 
-                logger.debug(f"Symbol info retrieved for {symbol_data.get('symbol', 'Unknown')}")
-                return symbol_data
-            else:
+            try:
+                symbol_data = self._cached_json(symbol_file)
+            except FileNotFoundError:
                 logger.warning(f"Symbol info file not found: {symbol_file}")
                 return {}
 
+            logger.debug("Symbol info retrieved for %s", symbol_data.get('symbol', 'Unknown'))
+            return dict(symbol_data)
+
         except Exception as e:
             logger.error(f"Error reading symbol info: {e}")
             return {}
@@ -1195,19 +1640,18 @@ class MT5Connector:
             List of pending orders
         """
         try:
-            orders_file = os.path.join(getattr(self, 'files_dir', self.config.get_mt5_files_directory()), "orders.json")
+            orders_file = self.orders_file_path
 
-            if os.path.exists(orders_file):
-                with open(orders_file, 'r') as f:
-                    orders_data = json.load(f)
-
-                orders = orders_data.get('orders', [])
-                logger.debug(f"Retrieved {len(orders)} pending orders")
-                return orders
-            else:
+            try:
+                orders_data = self._cached_json(orders_file)
+            except FileNotFoundError:
                 logger.warning(f"Orders file not found: {orders_file}")
                 return []
 
+            orders = orders_data.get('orders', [])
+            logger.debug("Retrieved %d pending orders", len(orders))
+            return list(orders)
+
         except Exception as e:
             logger.error(f"Error reading pending orders: {e}")
             return []
@@ -1220,25 +1664,41 @@ class MT5Connector:
             Dict with keys: symbol, timeframe, bars (list of OHLCV objects)
         """
         try:
-            rates_file = os.path.join(getattr(self, 'files_dir', self.config.get_mt5_files_directory()), "rates_M1.json")
-
-            if os.path.exists(rates_file):
-                with open(rates_file, 'r') as f:
-                    data = json.load(f)
-                # Minimal validation
-                if isinstance(data, dict) and 'bars' in data:
-                    logger.debug(f"Rates M1 retrieved: {len(data.get('bars', []))} bars")
-                    return data
-                else:
-                    logger.warning("rates_M1.json has unexpected structure")
-                    return {}
-            else:
+            rates_file = self.rates_m1_file_path
+
+            try:
+                data = self._cached_json(rates_file)
+            except FileNotFoundError:
                 logger.warning(f"Rates file not found: {rates_file}")
                 return {}
+
+            # Minimal validation
+            if isinstance(data, dict) and 'bars' in data:
+                logger.debug("Rates M1 retrieved: %d bars", len(data['bars']))
+                return dict(data)
+            else:
+                logger.warning("rates_M1.json has unexpected structure")
+                return {}
         except Exception as e:
             logger.error(f"Error reading rates M1 data: {e}")
             return {}
 
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Read the EA's per-tick exports in one call
+
+        Returns:
+            Dict with 'tick', 'order_book', 'account_info', 'rates_m1' and
+            'pending_orders', each as returned by the matching get_* method
+        """
+        return {
+            'tick': self.get_tick_data(),
+            'order_book': self.get_order_book(),
+            'account_info': self.get_account_info(),
+            'rates_m1': self.get_rates_m1(),
+            'pending_orders': self.get_pending_orders(),
+        }
+
     def __str__(self) -> str:
         """String representation"""
         status = "Connected" if self.connection_status else "Disconnected"
@@ -1247,13 +1707,24 @@ class MT5Connector:
 
 # Global connector instance
 _connector_instance: Optional[MT5Connector] = None
+_connector_lock = threading.Lock()
 
 
 def get_connector() -> MT5Connector:
     """Get global MT5 connector instance (singleton pattern)"""
     global _connector_instance
-    if _connector_instance is None:
-        _connector_instance = MT5Connector()
-    return _connector_instance
-
-
+    connector = _connector_instance
+    if connector is None:
+        # Lock only on first use so concurrent callers cannot build two connectors
+        with _connector_lock:
+            connector = _connector_instance
+            if connector is None:
+                connector = _connector_instance = MT5Connector()
+    return connector
+
+
+def reset_connector() -> None:
+    """Drop the global connector instance so the next get_connector() builds a new one"""
+    global _connector_instance
+    with _connector_lock:
+        _connector_instance = None